@@ -6,16 +6,19 @@ to their deprecated decorator, or simply want to use the existing depcrators the
 from __future__ import annotations
 
 
+import os
+import sys
 import warnings
+from functools import update_wrapper
 
 
-import inspect
-from functools import wraps
-from typing import TYPE_CHECKING, Callable, TypeVar, ParamSpec
+from typing import TYPE_CHECKING, TypeVar, ParamSpec
 from typing_deprecated import Deprecated
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     P = ParamSpec("P")
     T = TypeVar("T")
 
@@ -36,35 +39,39 @@ def _rename_keyword_argument(
 ) -> None: ...
 
 
-def issue_deprecation_warning(message: str, *, version: str) -> None:
-    warnings.warn(message, DeprecationWarning, stacklevel=find_stacklevel())
+def _disabled_by_env() -> bool:
+    """Whether `TYPING_DEPRECATED_DISABLE` is set to a truthy value such as `1` or `true`."""
+    value = os.environ.get("TYPING_DEPRECATED_DISABLE", "")
+    return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
-def deprecate_function(
-    message: str, *, version: str
-) -> Callable[[Callable[P, T]], Callable[P, T]]:
-    """Decorator to mark a function as deprecated."""
+def issue_deprecation_warning(
+    message: str, *, version: str, stacklevel: int | None = None
+) -> None:
+    # Callers at a known depth pass `stacklevel` directly, only walk the stack when they don't.
+    if stacklevel is None:
+        stacklevel = find_stacklevel()
+    warnings.warn(message, DeprecationWarning, stacklevel=stacklevel)
 
-    def decorate(function: Callable[P, T]) -> Callable[P, T]:
-        @wraps(function)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            issue_deprecation_warning(
-                f"`{function.__qualname__}` is deprecated. {message}",
-                version=version,
-            )
-            return function(*args, **kwargs)
 
-        wrapper.__signature__ = inspect.signature(function)  # type: ignore[attr-defined]
-        return wrapper
+def _deprecated_wrapper(
+    function: Callable[P, T], message: str, version: str
+) -> Deprecated[Callable[P, T]]:
+    # Explicitly opted out, so skip the wrapper and its per-call overhead. Filters are left to `warnings.warn`.
+    if _disabled_by_env():
+        return function
 
-    return decorate
+    # Computed once at decoration time rather than on every call.
+    qualname = function.__qualname__
+    msg = sys.intern(f"`{qualname}` is deprecated. {message}")
 
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        # Point past `issue_deprecation_warning` and this wrapper to the caller.
+        issue_deprecation_warning(msg, version=version, stacklevel=3)
+        return function(*args, **kwargs)
 
-def deprecate_renamed_function(
-    new_name: str, *, version: str
-) -> Callable[[Callable[P, T]], Callable[P, T]]:
-    """Decorator to mark a function as deprecated due to being renamed (or moved)."""
-    return deprecate_function(f"It has been renamed to `{new_name}`.", version=version)
+    # `inspect.signature` follows `__wrapped__`, so the signature is resolved lazily on introspection.
+    return update_wrapper(wrapper, function)
 
 
 def deprecate_function(
@@ -73,16 +80,19 @@ def deprecate_function(
     """Decorator to mark a function as deprecated."""
 
     def decorate(function: Callable[P, T]) -> Deprecated[Callable[P, T]]:
-        @wraps(function)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            issue_deprecation_warning(
-                f"`{function.__qualname__}` is deprecated. {message}",
-                version=version,
-            )
-            return function(*args, **kwargs)
-
-        wrapper.__signature__ = inspect.signature(function)  # type: ignore[attr-defined]
-        return wrapper
+        return _deprecated_wrapper(function, message, version)
+
+    return decorate
+
+
+def deprecate_renamed_function(
+    new_name: str, *, version: str
+) -> Callable[[Callable[P, T]], Deprecated[Callable[P, T]]]:
+    """Decorator to mark a function as deprecated due to being renamed (or moved)."""
+    message = f"It has been renamed to `{new_name}`."
+
+    def decorate(function: Callable[P, T]) -> Deprecated[Callable[P, T]]:
+        return _deprecated_wrapper(function, message, version)
 
     return decorate
 
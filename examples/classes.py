@@ -1,5 +1,6 @@
 import dataclasses
-from typing import ClassVar, Final, Optional
+import warnings
+from typing import Any, ClassVar, Final, Optional
 import pydantic
 
 from examples.typing_deprecated import Deprecated
@@ -36,7 +37,32 @@ class PydanticModel(pydantic.BaseModel):
 # Runtime error could be configured through `pydantic.ConfigDict`
 
 
-class PydanticModel(pydantic.BaseModel):
+class DeprecatedFieldsModel(pydantic.BaseModel):
+    # Names of the `Deprecated` fields, collected once at class creation instead of scanned per instance.
+    # Pydantic (2.11+) treats `Final` annotations as class variables, so those never show up here.
+    __pydantic_deprecated_fields__: ClassVar[frozenset[str]] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__pydantic_deprecated_fields__ = frozenset(
+            name
+            for name, field in cls.model_fields.items()
+            if Deprecated in field.metadata
+        )
+
+    def model_post_init(self, __context: Any) -> None:
+        filled = self.__pydantic_deprecated_fields__.intersection(self.model_fields_set)
+        if not filled:
+            return
+        if self.model_config.get("raise_on_deprecated"):
+            raise TypeError(f"Deprecated fields were set: {', '.join(sorted(filled))}")
+        for name in sorted(filled):
+            # `model_post_init` is called from `BaseModel.__init__`, point past both to the caller.
+            warnings.warn(f"`{name}` is deprecated.", DeprecationWarning, stacklevel=3)
+
+
+class PydanticModel(DeprecatedFieldsModel):
     model_config = {"raise_on_deprecated": True}
 
     my_pydantic_var: Deprecated[Optional[int]] = None
@@ -46,3 +72,12 @@ class PydanticModel(pydantic.BaseModel):
 
 
 # Now, if a deprecated field is filled, a runtime error will be raised.
+
+
+# Without `raise_on_deprecated`, filled deprecated fields warn instead, with or without a message.
+class PydanticWarningModel(DeprecatedFieldsModel):
+    my_pydantic_var: Deprecated[Optional[int]] = None
+    my_pydantic_var_msg: Deprecated[Optional[int], "Use `my_pydantic_var` instead"] = None
+
+
+PydanticWarningModel(my_pydantic_var=1, my_pydantic_var_msg=2)  # Warns for both fields.
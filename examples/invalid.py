@@ -1,6 +1,7 @@
 """Goes through some cases in which type-checkers should warn of `typing.Deprecated` being used in an incorrect manner."""
 
-from typing import Any, Callable
+from collections.abc import Callable
+from typing import Any
 from typing_deprecated import Deprecated
 from typing import TypeVar
 
@@ -1,8 +1,29 @@
 from typing import Annotated, Any
 
+try:
+    # Same subscription cache `typing` uses for `Union[...]`, `Generic[...]`, etc.
+    from typing import _tp_cache  # type: ignore[attr-defined]
+except ImportError:
+
+    def _tp_cache(func: Any) -> Any:
+        return func
+
 
 class Deprecated(Any):
     """Dummy class to demonstrate usage of the `typing.Deprecated` annotation."""
 
+    def __new__(cls, *args: Any, **kwargs: Any):
+        raise TypeError("Deprecated is a typing marker, not instantiable")
+
+    @_tp_cache
     def __class_getitem__(cls, params: Any):
-        return Annotated[params[0], params[1]]
+        if isinstance(params, tuple):
+            if len(params) != 2:
+                raise TypeError(
+                    f"Deprecated[...] takes a type and an optional message, got {len(params)} arguments"
+                )
+            # Keep the class as a marker ahead of the message, so the field can still be recognized at runtime.
+            return Annotated[params[0], cls, params[1]]
+        # `Deprecated[int]` passes a single non-tuple param, use the class itself as the metadata.
+        # A bare `Deprecated` never reaches here and is left to the type-checker.
+        return Annotated[params, cls]